@@ -36,7 +36,7 @@ def extract_bank_statement_data(pdf_path: str, password: Optional[str] = None,
         # Handle legacy bank_name parameter for backward compatibility
         if bank_name and not bank_id:
             bank_id = _convert_bank_name_to_id(bank_name)
-            logger.info(f"Converted legacy bank_name '{bank_name}' to bank_id '{bank_id}'")
+            logger.info("Converted legacy bank_name '%s' to bank_id '%s'", bank_name, bank_id)
 
         # Validate required bank_id parameter
         if not bank_id:
@@ -47,7 +47,7 @@ def extract_bank_statement_data(pdf_path: str, password: Optional[str] = None,
         if not validate_pdf_file(pdf_path):
             raise ValueError(f"Invalid PDF file: {pdf_path}")
 
-        logger.info(f"Starting extraction for bank: {bank_id}, enhanced: {enhanced}")
+        logger.info("Starting extraction for bank: %s, enhanced: %s", bank_id, enhanced)
 
         # Optional compatibility pre-check
         if os.path.exists(pdf_path):
@@ -55,11 +55,11 @@ def extract_bank_statement_data(pdf_path: str, password: Optional[str] = None,
             if not bank_config_service.validate_bank_compatibility(
                 bank_id, file_size, bool(password)
             ):
-                logger.warning(f"Compatibility check failed for {bank_id} (file size: {file_size:.2f}MB, password: {bool(password)})")
+                logger.warning("Compatibility check failed for %s (file size: %.2fMB, password: %s)", bank_id, file_size, bool(password))
 
         # Get dynamic extractor from database configuration
         extractor = bank_config_service.get_extractor(bank_id)
-        logger.info(f"Using extractor: {extractor.__class__.__name__} v{extractor.version}")
+        logger.info("Using extractor: %s v%s", extractor.__class__.__name__, extractor.version)
 
         # Execute extraction with the dynamic extractor
         result = extractor.extract_complete_statement(pdf_path, password)
@@ -70,16 +70,16 @@ def extract_bank_statement_data(pdf_path: str, password: Optional[str] = None,
 
         if enhanced:
             # Return the complete enhanced format
-            logger.info(f"Extraction completed successfully for {bank_id}. Total transactions: {result.get('total_transactions', 0)}")
+            logger.info("Extraction completed successfully for %s. Total transactions: %s", bank_id, result.get('total_transactions', 0))
             return result
         else:
             # Return legacy format for backward compatibility
             transactions = result.get('transactions', [])
-            logger.info(f"Extraction completed successfully for {bank_id}. Total transactions: {len(transactions)} (legacy format)")
+            logger.info("Extraction completed successfully for %s. Total transactions: %d (legacy format)", bank_id, len(transactions))
             return transactions
 
     except Exception as e:
-        logger.error(f"Error extracting {bank_id or bank_name} statement from {pdf_path}: {e}")
+        logger.error("Error extracting %s statement from %s: %s", bank_id or bank_name, pdf_path, e)
         raise
 
 
@@ -153,10 +153,10 @@ def reload_bank_extractor(bank_id: str) -> bool:
     """
     try:
         bank_config_service.reload_extractor(bank_id)
-        logger.info(f"Successfully reloaded extractor for bank {bank_id}")
+        logger.info("Successfully reloaded extractor for bank %s", bank_id)
         return True
     except Exception as e:
-        logger.error(f"Failed to reload extractor for {bank_id}: {e}")
+        logger.error("Failed to reload extractor for %s: %s", bank_id, e)
         return False
 
 
@@ -174,22 +174,22 @@ def validate_pdf_file(pdf_path: str) -> bool:
         path = Path(pdf_path)
 
         if not path.exists():
-            logger.error(f"PDF file not found: {pdf_path}")
+            logger.error("PDF file not found: %s", pdf_path)
             return False
 
         if not path.suffix.lower() == '.pdf':
-            logger.error(f"File is not a PDF: {pdf_path}")
+            logger.error("File is not a PDF: %s", pdf_path)
             return False
 
         # Basic file size check
         if path.stat().st_size == 0:
-            logger.error(f"PDF file is empty: {pdf_path}")
+            logger.error("PDF file is empty: %s", pdf_path)
             return False
 
         return True
 
     except Exception as e:
-        logger.error(f"Error validating PDF file: {e}")
+        logger.error("Error validating PDF file: %s", e)
         return False
 
 
@@ -232,7 +232,7 @@ def get_bank_info(bank_id: str) -> Dict:
             'extractor_metadata': extractor.get_extraction_metadata()
         }
     except Exception as e:
-        logger.error(f"Error getting bank info for {bank_id}: {e}")
+        logger.error("Error getting bank info for %s: %s", bank_id, e)
         return {}
 
 
@@ -58,10 +58,18 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import logging
 from pathlib import Path
-from .base_extractor import BaseBankExtractor
+from .base_extractor import BaseBankExtractor, extract_page_texts
 
 logger = logging.getLogger(__name__)
 
+# Per-line transaction parsing patterns, compiled once at import instead of
+# being re-looked-up in the regex cache for every statement line
+TXN_DATE_PATTERN = re.compile(r'^(\d{2}-\d{2}-\d{4})\s+(\d{2}-\d{2}-\d{4})\s+(.+)')
+BALANCE_PATTERN = re.compile(r'([\d,]+\.?\d*)Cr\s+')
+AMOUNT_PATTERN = re.compile(r'([\d,]+\.?\d*)')
+DESCRIPTION_AMOUNT_PATTERN = re.compile(r'\s+[\d,]+\.?\d*\s')
+TRAILING_BALANCE_PATTERN = re.compile(r'\s+[\d,]+\.?\d*Cr.*$')
+
 # Security constants
 MAX_FILE_SIZE_MB = 50  # Maximum allowed PDF file size in MB
 ALLOWED_FILE_EXTENSIONS = {'.pdf'}  # Only PDF files allowed
@@ -369,7 +377,7 @@ class APGVBExtractor(BaseBankExtractor):
                 self.statement_metadata = self._extract_statement_metadata(pdf_reader)
 
                 # Extract all transactions from all pages
-                self.transactions = self._extract_all_transactions(pdf_reader)
+                self.transactions = self._extract_all_transactions(validated_path, password, len(pdf_reader.pages))
 
                 # Calculate financial summary
                 self.financial_summary = self._calculate_financial_summary()
@@ -493,7 +501,7 @@ class APGVBExtractor(BaseBankExtractor):
         for i in range(min(2, len(pdf_reader.pages))):
             combined_text += pdf_reader.pages[i].extract_text() + "\n"
 
-        lines = combined_text.split('\n')
+        lines = combined_text.splitlines()
 
         # Process each line to extract different metadata components
         # APGVB spreads metadata across multiple lines in the header section
@@ -550,7 +558,7 @@ class APGVBExtractor(BaseBankExtractor):
 
         return metadata
 
-    def _extract_all_transactions(self, pdf_reader: pypdf.PdfReader) -> List[Dict]:
+    def _extract_all_transactions(self, pdf_path: str, password: Optional[str], num_pages: int) -> List[Dict]:
         """
         Extract and process transactions from all pages of the APGVB PDF statement.
 
@@ -559,8 +567,9 @@ class APGVBExtractor(BaseBankExtractor):
         It handles APGVB's pagination where transactions can span multiple pages.
 
         Args:
-            pdf_reader: PyPDF reader object for the opened APGVB PDF statement.
-                Must contain readable pages with transaction data.
+            pdf_path: Validated path to the APGVB PDF statement on disk.
+            password: Password for encrypted PDFs, or None.
+            num_pages: Total page count of the statement.
 
         Returns:
             List[Dict]: Complete list of all transactions from all pages, where each
@@ -578,14 +587,14 @@ class APGVBExtractor(BaseBankExtractor):
                 }
 
         Processing Strategy:
-            1. Iterates through each PDF page sequentially
-            2. Extracts text content and skips empty pages
+            1. Extracts text for all pages (in parallel for large PDFs)
+            2. Iterates page texts in order and skips empty pages
             3. Processes transactions using page-specific extraction logic
             4. Maintains continuous transaction counter across pages
             5. Combines results from all pages into single list
 
         Example:
-            >>> transactions = extractor._extract_all_transactions(pdf_reader)
+            >>> transactions = extractor._extract_all_transactions(pdf_path, password, num_pages)
             >>> print(f"Total transactions: {len(transactions)}")
             >>> for tx in transactions[:3]:
             ...     print(f"{tx['Date']}: {tx['Remarks']} - ₹{tx.get('Credit', tx.get('Debit', '0'))}")
@@ -599,8 +608,7 @@ class APGVBExtractor(BaseBankExtractor):
 
         # Process each page to extract transactions
         # APGVB statements can span multiple pages with continuous transaction flow
-        for page_num, page in enumerate(pdf_reader.pages):
-            page_text = page.extract_text()
+        for page_num, page_text in enumerate(extract_page_texts(pdf_path, password, num_pages)):
             if not page_text:
                 continue  # Skip empty pages (rare but possible)
 
@@ -663,7 +671,7 @@ class APGVBExtractor(BaseBankExtractor):
             format changes.
         """
         transactions = []
-        lines = page_text.split('\n')
+        lines = page_text.splitlines()
         transaction_counter = start_counter
         i = 0
 
@@ -716,8 +724,7 @@ class APGVBExtractor(BaseBankExtractor):
 
     def _parse_transaction_line(self, line: str) -> Optional[Tuple[str, str]]:
         """Parse transaction line to extract date and details."""
-        date_pattern = r'^(\d{2}-\d{2}-\d{4})\s+(\d{2}-\d{2}-\d{4})\s+(.+)'
-        date_match = re.match(date_pattern, line)
+        date_match = TXN_DATE_PATTERN.match(line)
 
         if not date_match:
             return None
@@ -864,8 +871,7 @@ class APGVBExtractor(BaseBankExtractor):
 
     def _extract_balance_from_line(self, line: str) -> Optional[Tuple[float, str]]:
         """Extract current balance and preceding text from line."""
-        balance_pattern = r'([\d,]+\.?\d*)Cr\s+'
-        balance_match = re.search(balance_pattern, line)
+        balance_match = BALANCE_PATTERN.search(line)
 
         if not balance_match:
             return None
@@ -877,8 +883,7 @@ class APGVBExtractor(BaseBankExtractor):
 
     def _extract_transaction_amount(self, before_balance: str) -> Optional[float]:
         """Extract transaction amount from text before balance."""
-        amount_pattern = r'([\d,]+\.?\d*)'
-        amounts = re.findall(amount_pattern, before_balance)
+        amounts = AMOUNT_PATTERN.findall(before_balance)
 
         if not amounts:
             return None
@@ -939,8 +944,7 @@ class APGVBExtractor(BaseBankExtractor):
         """
         # Primary approach: Find first numeric amount and take everything before it
         # Pattern matches amounts like "2,000.00", "295.00", "1,500" etc.
-        amount_pattern = r'\s+[\d,]+\.?\d*\s'
-        match = re.search(amount_pattern, full_line)
+        match = DESCRIPTION_AMOUNT_PATTERN.search(full_line)
 
         if match:
             # Found an amount - everything before it is the description
@@ -948,8 +952,7 @@ class APGVBExtractor(BaseBankExtractor):
         else:
             # Fallback: Remove balance patterns if no clear amount separation
             # This handles edge cases where amounts might be formatted differently
-            balance_pattern = r'\s+[\d,]+\.?\d*Cr.*$'
-            return re.sub(balance_pattern, '', full_line).strip()
+            return TRAILING_BALANCE_PATTERN.sub('', full_line).strip()
 
     def _calculate_financial_summary(self) -> Dict:
         """
@@ -5,8 +5,65 @@ Ensures all bank extractors follow a standardized contract for consistency
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional
 import logging
+import math
+import os
+
+logger = logging.getLogger(__name__)
+
+# Below this page count the process startup cost outweighs parallel extraction
+PARALLEL_PAGE_THRESHOLD = 3
+
+
+def _extract_page_text_batch(pdf_path: str, password: Optional[str], page_indices) -> List[str]:
+    """Extract text for a batch of pages (also used as the process pool worker)"""
+    import pypdf
+
+    with open(pdf_path, 'rb') as file:
+        pdf_reader = pypdf.PdfReader(file)
+        if pdf_reader.is_encrypted and password:
+            if pdf_reader.decrypt(password) == 0:
+                pdf_reader.decrypt(password.strip())
+        return [pdf_reader.pages[i].extract_text() for i in page_indices]
+
+
+def extract_page_texts(pdf_path: str, password: Optional[str], num_pages: int) -> List[str]:
+    """
+    Extract the text of every page, using worker processes for large PDFs
+
+    pypdf text extraction is CPU-bound pure Python that holds the GIL, so
+    multi-page statements only speed up across processes. Each worker reopens
+    the PDF by path and handles a contiguous page range; results come back in
+    page order. Falls back to sequential extraction for small PDFs or when
+    the runtime cannot start worker processes (e.g. Lambda without /dev/shm).
+
+    Args:
+        pdf_path (str): Path to the PDF file
+        password (str, optional): Password for encrypted PDFs
+        num_pages (int): Total page count of the (already opened) PDF
+
+    Returns:
+        List[str]: Extracted text per page, in page order
+    """
+    workers = min(os.cpu_count() or 1, num_pages)
+    if num_pages < PARALLEL_PAGE_THRESHOLD or workers < 2:
+        return _extract_page_text_batch(pdf_path, password, range(num_pages))
+
+    batch_size = math.ceil(num_pages / workers)
+    batches = [range(start, min(start + batch_size, num_pages))
+               for start in range(0, num_pages, batch_size)]
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_extract_page_text_batch,
+                               [pdf_path] * len(batches),
+                               [password] * len(batches),
+                               batches)
+            return [text for batch in results for text in batch]
+    except OSError as e:
+        logger.warning(f"Process pool unavailable ({e}), extracting pages sequentially")
+        return _extract_page_text_batch(pdf_path, password, range(num_pages))
 
 
 class BaseBankExtractor(ABC):
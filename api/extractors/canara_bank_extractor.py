@@ -9,10 +9,14 @@ import re
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import logging
-from .base_extractor import BaseBankExtractor
+from .base_extractor import BaseBankExtractor, extract_page_texts
 
 logger = logging.getLogger(__name__)
 
+# Transaction rows start with a DD-MM-YYYY date - compiled once at import
+# since it is checked against nearly every statement line
+TXN_DATE_PATTERN = re.compile(r'^(\d{2}-\d{2}-\d{4})')
+
 
 class CanaraBankExtractor(BaseBankExtractor):
     """Extract comprehensive data from Canara Bank PDF statements"""
@@ -80,7 +84,7 @@ class CanaraBankExtractor(BaseBankExtractor):
                 self.statement_metadata = self._extract_statement_metadata(first_page_text)
 
                 # Extract all transactions from all pages
-                self.transactions = self._extract_all_transactions(pdf_reader)
+                self.transactions = self._extract_all_transactions(pdf_path, password, len(pdf_reader.pages))
 
                 # Calculate financial summary
                 self.financial_summary = self._calculate_financial_summary()
@@ -104,7 +108,7 @@ class CanaraBankExtractor(BaseBankExtractor):
             "currency": "INR"
         }
 
-        lines = first_page_text.split('\n')
+        lines = first_page_text.splitlines()
 
         for i, line in enumerate(lines):
             line = line.strip()
@@ -183,17 +187,16 @@ class CanaraBankExtractor(BaseBankExtractor):
 
         return metadata
 
-    def _extract_all_transactions(self, pdf_reader) -> List[Dict]:
-        """Extract transactions from all pages"""
+    def _extract_all_transactions(self, pdf_path: str, password: Optional[str], num_pages: int) -> List[Dict]:
+        """Extract transactions from all pages (page text extracted in parallel)"""
         all_transactions = []
-        opening_balance = None
+
+        page_texts = extract_page_texts(pdf_path, password, num_pages)
 
         # First extract opening balance from first page
-        first_page_text = pdf_reader.pages[0].extract_text()
-        opening_balance = self._extract_opening_balance(first_page_text)
+        opening_balance = self._extract_opening_balance(page_texts[0])
 
-        for page_num, page in enumerate(pdf_reader.pages):
-            page_text = page.extract_text()
+        for page_num, page_text in enumerate(page_texts):
             if not page_text:
                 continue
 
@@ -204,7 +207,7 @@ class CanaraBankExtractor(BaseBankExtractor):
 
     def _extract_opening_balance(self, first_page_text: str) -> float:
         """Extract opening balance from first page"""
-        lines = first_page_text.split('\n')
+        lines = first_page_text.splitlines()
         for line in lines:
             line = line.strip()
             if line.startswith('Opening Balance'):
@@ -217,7 +220,7 @@ class CanaraBankExtractor(BaseBankExtractor):
     def _extract_transactions_from_page(self, page_text: str, page_num: int, opening_balance: float = None) -> List[Dict]:
         """Extract transactions from a single page"""
         transactions = []
-        lines = page_text.split('\n')
+        lines = page_text.splitlines()
         transaction_counter = 1  # Add serial number counter
 
         i = 0
@@ -235,8 +238,7 @@ class CanaraBankExtractor(BaseBankExtractor):
                 continue
 
             # Look for transaction starting with date pattern DD-MM-YYYY
-            date_pattern = r'^(\d{2}-\d{2}-\d{4})'
-            date_match = re.match(date_pattern, line)
+            date_match = TXN_DATE_PATTERN.match(line)
 
             if date_match:
                 try:
@@ -282,7 +284,7 @@ class CanaraBankExtractor(BaseBankExtractor):
                 break
 
             # Stop if we hit next transaction (starts with date)
-            if i > start_index and re.match(r'^\d{2}-\d{2}-\d{4}', line):
+            if i > start_index and TXN_DATE_PATTERN.match(line):
                 combined_lines.pop()  # Remove this line as it's the next transaction
                 break
 
@@ -296,7 +298,7 @@ class CanaraBankExtractor(BaseBankExtractor):
 
         while i < len(lines):
             line = lines[i].strip()
-            if re.match(r'^\d{2}-\d{2}-\d{4}', line):
+            if TXN_DATE_PATTERN.match(line):
                 return i
             i += 1
 
@@ -9,10 +9,16 @@ import re
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import logging
-from .base_extractor import BaseBankExtractor
+from .base_extractor import BaseBankExtractor, extract_page_texts
 
 logger = logging.getLogger(__name__)
 
+# Per-line transaction parsing patterns, compiled once at import instead of
+# being re-looked-up in the regex cache for every statement line
+TXN_LINE_PATTERN = re.compile(r'^(\d+)\s+(\d{1,2}/\d{1,2}/\d{4})\s+([A-Z0-9]+)')
+AMOUNT_PATTERN = re.compile(r'(\d+\.?\d*)\s*\((Dr|Cr)\)')
+NEXT_TXN_PATTERN = re.compile(r'^\d+\s+\d{1,2}/\d{1,2}/\d{4}')
+
 
 class UnionBankExtractor(BaseBankExtractor):
     """Extract comprehensive data from Union Bank PDF statements"""
@@ -80,7 +86,7 @@ class UnionBankExtractor(BaseBankExtractor):
                 self.statement_metadata = self._extract_statement_metadata(first_page_text)
 
                 # Extract all transactions from all pages
-                self.transactions = self._extract_all_transactions(pdf_reader)
+                self.transactions = self._extract_all_transactions(pdf_path, password, len(pdf_reader.pages))
 
                 # Calculate financial summary
                 self.financial_summary = self._calculate_financial_summary()
@@ -104,7 +110,7 @@ class UnionBankExtractor(BaseBankExtractor):
             "currency": "INR"
         }
 
-        lines = first_page_text.split('\n')
+        lines = first_page_text.splitlines()
 
         # Extract customer information
         for i, line in enumerate(lines):
@@ -234,12 +240,11 @@ class UnionBankExtractor(BaseBankExtractor):
 
         return metadata
 
-    def _extract_all_transactions(self, pdf_reader) -> List[Dict]:
-        """Extract transactions from all pages"""
+    def _extract_all_transactions(self, pdf_path: str, password: Optional[str], num_pages: int) -> List[Dict]:
+        """Extract transactions from all pages (page text extracted in parallel)"""
         all_transactions = []
 
-        for page_num, page in enumerate(pdf_reader.pages):
-            page_text = page.extract_text()
+        for page_num, page_text in enumerate(extract_page_texts(pdf_path, password, num_pages)):
             if not page_text:
                 continue
 
@@ -251,7 +256,7 @@ class UnionBankExtractor(BaseBankExtractor):
     def _extract_transactions_from_page(self, page_text: str, page_num: int) -> List[Dict]:
         """Extract transactions from a single page"""
         transactions = []
-        lines = page_text.split('\n')
+        lines = page_text.splitlines()
 
         for i, line in enumerate(lines):
             line = line.strip()
@@ -262,8 +267,7 @@ class UnionBankExtractor(BaseBankExtractor):
                 continue
 
             # Match transaction pattern: starts with number
-            line_pattern = r'^(\d+)\s+(\d{1,2}/\d{1,2}/\d{4})\s+([A-Z0-9]+)'
-            line_match = re.match(line_pattern, line)
+            line_match = TXN_LINE_PATTERN.match(line)
 
             if line_match:
                 try:
@@ -283,15 +287,12 @@ class UnionBankExtractor(BaseBankExtractor):
         """Combine transaction lines that span multiple rows"""
         combined_line = lines[start_index].strip()
 
-        # Pattern to match amount format: number (Dr) or (Cr)
-        amount_pattern = r'(\d+\.?\d*)\s*\((Dr|Cr)\)'
-
         # Keep combining lines until we have both amount and balance
         j = start_index + 1
-        while j < len(lines) and len(re.findall(amount_pattern, combined_line)) < 2:
+        while j < len(lines) and len(AMOUNT_PATTERN.findall(combined_line)) < 2:
             next_line = lines[j].strip()
             # Stop if we hit the next transaction (starts with number) or empty line
-            if next_line and not re.match(r'^\d+\s+\d{1,2}/\d{1,2}/\d{4}', next_line):
+            if next_line and not NEXT_TXN_PATTERN.match(next_line):
                 combined_line += " " + next_line
                 j += 1
             else:
@@ -303,8 +304,7 @@ class UnionBankExtractor(BaseBankExtractor):
         """Parse individual transaction line"""
         try:
             # Extract basic components
-            line_pattern = r'^(\d+)\s+(\d{1,2}/\d{1,2}/\d{4})\s+([A-Z0-9]+)'
-            line_match = re.match(line_pattern, line)
+            line_match = TXN_LINE_PATTERN.match(line)
 
             if not line_match:
                 return None
@@ -314,8 +314,7 @@ class UnionBankExtractor(BaseBankExtractor):
             transaction_id = line_match.group(3)
 
             # Find amounts with (Dr) or (Cr)
-            amount_pattern = r'(\d+\.?\d*)\s*\((Dr|Cr)\)'
-            amount_matches = re.findall(amount_pattern, line)
+            amount_matches = AMOUNT_PATTERN.findall(line)
 
             if len(amount_matches) < 2:
                 return None
@@ -6,6 +6,7 @@ Direct API Gateway integration without FastAPI
 
 import json
 import logging
+import time
 from datetime import datetime, timezone
 import os
 import boto3
@@ -15,6 +16,13 @@ import base64
 import io
 from botocore.exceptions import ClientError
 
+# orjson encodes large statement listings ~5x faster than stdlib json;
+# fall back silently so the dependency stays optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Custom JSON encoder for DynamoDB Decimal types
 class DecimalEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -22,6 +30,17 @@ class DecimalEncoder(json.JSONEncoder):
             return float(obj)
         return super(DecimalEncoder, self).default(obj)
 
+def _decimal_to_float(obj):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_response(payload) -> str:
+    """Serialize a response body, preferring orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(payload, default=_decimal_to_float).decode('utf-8')
+    return json.dumps(payload, cls=DecimalEncoder)
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -44,6 +63,11 @@ if not BANK_CONFIGURATIONS_TABLE:
 s3_client = boto3.client('s3', region_name=AWS_REGION)
 dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
 
+# Bank configurations change rarely; serve repeat reads from a short-lived
+# in-memory cache so UI polling does not hit DynamoDB on every request
+BANK_CONFIG_CACHE_TTL = 300  # 5 minutes, matching BankConfigService.CACHE_TTL
+_bank_config_cache = {'expires_at': 0.0, 'banks': None}
+
 def handler(event, context):
     """
     AWS Lambda entry point for API Gateway events
@@ -248,11 +272,11 @@ def handle_get_statements(event):
                 'Content-Type': 'application/json',
                 'Access-Control-Allow-Origin': '*'
             },
-            'body': json.dumps({
+            'body': dumps_response({
                 'statements': statements,
                 'total': len(statements),
                 'status': 'success'
-            }, cls=DecimalEncoder)
+            })
         }
 
     except Exception as e:
@@ -263,43 +287,49 @@ def handle_get_statements(event):
                 'Content-Type': 'application/json',
                 'Access-Control-Allow-Origin': '*'
             },
-            'body': json.dumps({
+            'body': dumps_response({
                 'error': 'Internal Server Error',
                 'message': 'Failed to retrieve statements',
                 'statements': [],
                 'total': 0,
                 'status': 'error'
-            }, cls=DecimalEncoder)
+            })
         }
 
 
 def handle_get_bank_configurations():
     """Handle GET /configurations/banks endpoint"""
     try:
-        table = dynamodb.Table(BANK_CONFIGURATIONS_TABLE)
-
-        # Query all bank configurations with status ACTIVE
-        response = table.query(
-            KeyConditionExpression=Key('PK').eq('BANK_CONFIG'),
-            FilterExpression='#status = :status',
-            ExpressionAttributeNames={
-                '#status': 'Status'
-            },
-            ExpressionAttributeValues={
-                ':status': 'ACTIVE'
-            }
-        )
-
-        # Transform to minimal response format
-        active_banks = []
-        for item in response.get('Items', []):
-            active_banks.append({
-                'id': item.get('BankCode'),
-                'name': item.get('BankName')
-            })
+        # Serve from cache while fresh
+        active_banks = _bank_config_cache['banks']
+        if active_banks is None or time.time() >= _bank_config_cache['expires_at']:
+            table = dynamodb.Table(BANK_CONFIGURATIONS_TABLE)
+
+            # Query all bank configurations with status ACTIVE
+            response = table.query(
+                KeyConditionExpression=Key('PK').eq('BANK_CONFIG'),
+                FilterExpression='#status = :status',
+                ExpressionAttributeNames={
+                    '#status': 'Status'
+                },
+                ExpressionAttributeValues={
+                    ':status': 'ACTIVE'
+                }
+            )
+
+            # Transform to minimal response format
+            active_banks = []
+            for item in response.get('Items', []):
+                active_banks.append({
+                    'id': item.get('BankCode'),
+                    'name': item.get('BankName')
+                })
+
+            # Sort alphabetically by bank name
+            active_banks.sort(key=lambda x: x['name'])
 
-        # Sort alphabetically by bank name
-        active_banks.sort(key=lambda x: x['name'])
+            _bank_config_cache['banks'] = active_banks
+            _bank_config_cache['expires_at'] = time.time() + BANK_CONFIG_CACHE_TTL
 
         return {
             'statusCode': 200,
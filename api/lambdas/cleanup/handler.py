@@ -15,7 +15,7 @@ import logging
 # Add parent directories to path to import our modules  
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from logging_config import setup_logging
+from logging_config import setup_logging, flush_logs
 
 # Setup logging for Lambda
 setup_logging()
@@ -93,6 +93,10 @@ def handler(event, context):
             })
         }
 
+    finally:
+        # Drain the async log queue before the execution environment freezes
+        flush_logs()
+
 def cleanup_old_jobs(cutoff_date: datetime) -> Dict:
     """
     Clean up old job records from DynamoDB
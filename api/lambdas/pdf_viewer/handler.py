@@ -9,7 +9,6 @@ import os
 import boto3
 from decimal import Decimal
 import base64
-import pypdf
 import io
 from botocore.exceptions import ClientError
 
@@ -178,6 +177,10 @@ def handle_get_pdf(job_id, cors_headers):
         # If PDF is password protected, unlock it
         if password:
             try:
+                # Deferred import: only the encrypted-PDF path pays the pypdf
+                # load cost, keeping cold starts fast for plain statements
+                import pypdf
+
                 # Create a PDF reader
                 pdf_reader = pypdf.PdfReader(io.BytesIO(pdf_content))
 
@@ -198,16 +198,17 @@ def process_message(record: Dict, context) -> Dict:
         # Update job status to processing
         update_job_status(job_id, "processing", {"started_at": context.aws_request_id})
         
-        # Download PDF from S3
-        pdf_content = download_from_s3(s3_key)
-        
-        # Extract transactions
+        # Stream PDF from S3 straight to disk so the file never sits fully in
+        # memory - pypdf then reads it through file-backed random access
         import tempfile
         with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-            tmp_file.write(pdf_content)
             tmp_file_path = tmp_file.name
-        
+
         try:
+            # Download inside the try so a failed download still removes the
+            # placeholder instead of leaking it into the warm container's /tmp
+            download_from_s3(s3_key, tmp_file_path)
+
             # Step 1: Validate PDF before processing
             validator = PDFValidator()
             validation_result = validator.validate(tmp_file_path, password)
@@ -397,11 +398,10 @@ def process_message(record: Dict, context) -> Dict:
         
         raise
 
-def download_from_s3(s3_key: str) -> bytes:
-    """Download file from S3"""
+def download_from_s3(s3_key: str, local_path: str) -> None:
+    """Download file from S3 to a local path in streamed chunks"""
     try:
-        response = s3_client.get_object(Bucket=S3_BUCKET_NAME, Key=s3_key)
-        return response['Body'].read()
+        s3_client.download_file(S3_BUCKET_NAME, s3_key, local_path)
     except Exception as e:
         logger.error(f"Failed to download from S3: {s3_key}", exc_info=True)
         raise
@@ -9,6 +9,7 @@ import logging
 from datetime import datetime, timezone
 import os
 import boto3
+from botocore.config import Config
 from decimal import Decimal
 
 # Import shared formatting utilities
@@ -18,6 +19,13 @@ from formatters.transaction_formatter import format_transactions_for_ui
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# orjson encodes large transaction payloads ~5x faster than stdlib json;
+# fall back silently so the dependency stays optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Custom JSON encoder for DynamoDB Decimal types
 class DecimalEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -25,6 +33,17 @@ class DecimalEncoder(json.JSONEncoder):
             return float(obj)
         return super(DecimalEncoder, self).default(obj)
 
+def _decimal_to_float(obj):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_response(payload) -> str:
+    """Serialize a response body, preferring orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(payload, default=_decimal_to_float).decode('utf-8')
+    return json.dumps(payload, cls=DecimalEncoder)
+
 # Configuration - fail fast if environment variables are missing
 S3_BUCKET_NAME = os.getenv('S3_BUCKET_NAME')
 JOBS_TABLE_NAME = os.getenv('JOBS_TABLE_NAME')
@@ -36,9 +55,20 @@ if not S3_BUCKET_NAME:
 if not JOBS_TABLE_NAME:
     raise ValueError("JOBS_TABLE_NAME environment variable is required")
 
-# Initialize AWS clients
-s3_client = boto3.client('s3', region_name=AWS_REGION)
-dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
+# Shared HTTP client settings: keep-alive and a pool large enough to reuse
+# TLS sessions across the DynamoDB and S3 calls made per request
+BOTO_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'mode': 'standard', 'max_attempts': 3},
+    connect_timeout=2,
+    read_timeout=10
+)
+
+# Initialize AWS clients from one shared session instead of one session each
+boto_session = boto3.session.Session(region_name=AWS_REGION)
+s3_client = boto_session.client('s3', config=BOTO_CONFIG)
+dynamodb = boto_session.resource('dynamodb', config=BOTO_CONFIG)
 
 def handler(event, context):
     """
@@ -71,7 +101,7 @@ def handler(event, context):
             return {
                 'statusCode': 200,
                 'headers': cors_headers,
-                'body': json.dumps({'message': 'CORS preflight'})
+                'body': dumps_response({'message': 'CORS preflight'})
             }
 
         # Only handle GET requests
@@ -79,7 +109,7 @@ def handler(event, context):
             return {
                 'statusCode': 405,
                 'headers': cors_headers,
-                'body': json.dumps({
+                'body': dumps_response({
                     'error': 'Method Not Allowed',
                     'message': 'Only GET method is supported'
                 })
@@ -95,10 +125,10 @@ def handler(event, context):
             return {
                 'statusCode': 400,
                 'headers': cors_headers,
-                'body': json.dumps({
+                'body': dumps_response({
                     'error': 'Bad Request',
                     'message': 'job_id is required as path or query parameter'
-                }, cls=DecimalEncoder)
+                })
             }
 
         return handle_get_statement_data(job_id, cors_headers)
@@ -111,7 +141,7 @@ def handler(event, context):
                 'Content-Type': 'application/json',
                 'Access-Control-Allow-Origin': '*'
             },
-            'body': json.dumps({
+            'body': dumps_response({
                 'error': 'Internal Server Error',
                 'message': str(e),
                 'request_id': context.aws_request_id
@@ -130,10 +160,10 @@ def handle_get_statement_data(job_id, cors_headers):
             return {
                 'statusCode': 404,
                 'headers': cors_headers,
-                'body': json.dumps({
+                'body': dumps_response({
                     'error': 'Statement not found',
                     'message': f'No statement found with ID: {job_id}'
-                }, cls=DecimalEncoder)
+                })
             }
 
         job_item = response['Item']
@@ -143,12 +173,12 @@ def handle_get_statement_data(job_id, cors_headers):
             return {
                 'statusCode': 400,
                 'headers': cors_headers,
-                'body': json.dumps({
+                'body': dumps_response({
                     'error': 'Processing not complete',
                     'message': f'Statement processing status: {job_item.get("status", "unknown")}',
                     'status': job_item.get('status', 'unknown'),
                     'job_id': job_id
-                }, cls=DecimalEncoder)
+                })
             }
 
         # Get the S3 results key
@@ -158,11 +188,11 @@ def handle_get_statement_data(job_id, cors_headers):
             return {
                 'statusCode': 404,
                 'headers': cors_headers,
-                'body': json.dumps({
+                'body': dumps_response({
                     'error': 'Results not found',
                     'message': 'No results file available for this statement',
                     'job_id': job_id
-                }, cls=DecimalEncoder)
+                })
             }
 
         # Fetch the JSON data from S3
@@ -189,7 +219,7 @@ def handle_get_statement_data(job_id, cors_headers):
             return {
                 'statusCode': 200,
                 'headers': cors_headers,
-                'body': json.dumps({
+                'body': dumps_response({
                     'status': 'success',
                     'job_id': job_id,
                     'statement_metadata': job_item.get('statement_metadata', {}),
@@ -199,7 +229,7 @@ def handle_get_statement_data(job_id, cors_headers):
                     'upload_timestamp': job_item.get('upload_timestamp'),
                     'total_transactions': job_item.get('total_transactions'),
                     'data': statement_data
-                }, cls=DecimalEncoder)
+                })
             }
 
         except s3_client.exceptions.NoSuchKey:
@@ -207,12 +237,12 @@ def handle_get_statement_data(job_id, cors_headers):
             return {
                 'statusCode': 404,
                 'headers': cors_headers,
-                'body': json.dumps({
+                'body': dumps_response({
                     'error': 'Results file not found',
                     'message': 'The results file has been moved or deleted',
                     'job_id': job_id,
                     's3_key': results_s3_key
-                }, cls=DecimalEncoder)
+                })
             }
 
         except json.JSONDecodeError as e:
@@ -220,11 +250,11 @@ def handle_get_statement_data(job_id, cors_headers):
             return {
                 'statusCode': 500,
                 'headers': cors_headers,
-                'body': json.dumps({
+                'body': dumps_response({
                     'error': 'Invalid data format',
                     'message': 'The results file contains invalid JSON',
                     'job_id': job_id
-                }, cls=DecimalEncoder)
+                })
             }
 
         except Exception as e:
@@ -232,11 +262,11 @@ def handle_get_statement_data(job_id, cors_headers):
             return {
                 'statusCode': 500,
                 'headers': cors_headers,
-                'body': json.dumps({
+                'body': dumps_response({
                     'error': 'Storage access error',
                     'message': 'Failed to retrieve data from storage',
                     'job_id': job_id
-                }, cls=DecimalEncoder)
+                })
             }
 
     except Exception as e:
@@ -244,9 +274,9 @@ def handle_get_statement_data(job_id, cors_headers):
         return {
             'statusCode': 500,
             'headers': cors_headers,
-            'body': json.dumps({
+            'body': dumps_response({
                 'error': 'Internal Server Error',
                 'message': 'Failed to retrieve statement data',
                 'job_id': job_id
-            }, cls=DecimalEncoder)
+            })
         }
\ No newline at end of file
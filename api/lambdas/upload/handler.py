@@ -4,13 +4,17 @@ AWS Lambda handler for PDF Upload functionality
 Handles file upload and storage to S3
 """
 
+import asyncio
 import json
 import base64
 import logging
+import re
 from datetime import datetime, timezone, timedelta
 import uuid
 import os
 import boto3
+import aioboto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from boto3.dynamodb.conditions import Key
 from decimal import Decimal
@@ -36,10 +40,50 @@ if not PROCESSING_QUEUE_URL:
 if not BANK_CONFIGURATIONS_TABLE:
     raise ValueError("BANK_CONFIGURATIONS_TABLE environment variable is required")
 
-# Initialize AWS clients
-s3_client = boto3.client('s3', region_name=AWS_REGION)
-sqs_client = boto3.client('sqs', region_name=AWS_REGION)
-dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
+# Shared HTTP client settings: keep-alive and a pool large enough to reuse
+# TLS sessions across the S3/SQS/DynamoDB calls made per request
+BOTO_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'mode': 'standard', 'max_attempts': 3},
+    connect_timeout=2,
+    read_timeout=10
+)
+
+# Initialize AWS clients from one shared session instead of one session each
+boto_session = boto3.session.Session(region_name=AWS_REGION)
+s3_client = boto_session.client('s3', config=BOTO_CONFIG)
+sqs_client = boto_session.client('sqs', config=BOTO_CONFIG)
+dynamodb = boto_session.resource('dynamodb', config=BOTO_CONFIG)
+
+# Async session for fanning out independent S3/DynamoDB calls concurrently.
+# One event loop per container: asyncio.run would tear the loop down after
+# every invocation, destroying the clients opened on it
+aio_session = aioboto3.Session()
+aio_loop = asyncio.new_event_loop()
+
+# aioboto3 client/resource contexts entered lazily and kept for the life of
+# the container - per-invocation setup costs more than the fan-out saves
+_aio_clients = {}
+
+async def _get_aio_clients():
+    """Open the async S3 client and jobs table once per container"""
+    if not _aio_clients:
+        s3 = await aio_session.client(
+            's3', region_name=AWS_REGION, config=BOTO_CONFIG
+        ).__aenter__()
+        ddb = await aio_session.resource(
+            'dynamodb', region_name=AWS_REGION, config=BOTO_CONFIG
+        ).__aenter__()
+        _aio_clients['s3'] = s3
+        _aio_clients['jobs_table'] = await ddb.Table(JOBS_TABLE_NAME)
+    return _aio_clients
+
+# Characters not allowed in S3 key filenames, compiled once at import
+UNSAFE_FILENAME_PATTERN = re.compile(r'[^A-Za-z0-9._-]')
+
+# Job records expire after 60 days - precomputed in seconds for TTL math
+JOB_TTL_SECONDS = 60 * 24 * 60 * 60
 
 def handler(event, context):
     """
@@ -99,7 +143,7 @@ def handler(event, context):
 
 
 def parse_multipart_data(body, content_type):
-    """Parse multipart form data from API Gateway event"""
+    """Parse multipart form data (as bytes) from API Gateway event"""
     try:
         # Extract boundary from content-type header
         boundary = None
@@ -109,6 +153,11 @@ def parse_multipart_data(body, content_type):
         if not boundary:
             raise ValueError("No boundary found in content-type")
 
+        # Work on bytes throughout - avoids a full latin-1 round-trip of the
+        # file payload (tens of MB of transcoding for max-size uploads)
+        boundary_bytes = boundary.encode('latin-1')
+        boundary_marker = b'--' + boundary_bytes
+
         # Parse the multipart data
         file_data = None
         filename = None
@@ -116,23 +165,23 @@ def parse_multipart_data(body, content_type):
         bank_id = None
 
         # Split by boundary
-        parts = body.split(f'--{boundary}')
+        parts = body.split(boundary_marker)
 
         for part in parts:
-            if not part.strip() or part.strip() == '--':
+            if not part.strip() or part.strip() == b'--':
                 continue
 
             # Split headers from body
-            if '\r\n\r\n' in part:
-                headers_section, content = part.split('\r\n\r\n', 1)
-            elif '\n\n' in part:
-                headers_section, content = part.split('\n\n', 1)
+            if b'\r\n\r\n' in part:
+                headers_section, content = part.split(b'\r\n\r\n', 1)
+            elif b'\n\n' in part:
+                headers_section, content = part.split(b'\n\n', 1)
             else:
                 continue
 
-            # Parse headers
+            # Parse headers (always ASCII-compatible, decode just this section)
             headers = {}
-            for line in headers_section.strip().split('\n'):
+            for line in headers_section.decode('latin-1').strip().split('\n'):
                 if ':' in line:
                     key, value = line.split(':', 1)
                     headers[key.strip().lower()] = value.strip()
@@ -144,9 +193,8 @@ def parse_multipart_data(body, content_type):
                 # Extract filename
                 filename_match = content_disposition.split('filename="')[1].split('"')[0]
                 filename = filename_match
-                # Remove trailing boundary markers and whitespace
-                content = content.rstrip().rstrip(f'--{boundary}').rstrip('--').rstrip()
-                file_data = content.encode('latin-1')  # Preserve binary data
+                # Remove trailing boundary markers and whitespace, keep raw bytes
+                file_data = content.rstrip().rstrip(boundary_marker).rstrip(b'--').rstrip()
 
             # Check if this is the password field
             elif 'name="password"' in content_disposition:
@@ -155,11 +203,11 @@ def parse_multipart_data(body, content_type):
 
                 # Remove boundary markers more precisely to avoid truncating password
                 password = content.strip()
-                if password.endswith(f'--{boundary}'):
-                    password = password[:-len(f'--{boundary}')]
-                elif password.endswith('--'):
+                if password.endswith(boundary_marker):
+                    password = password[:-len(boundary_marker)]
+                elif password.endswith(b'--'):
                     password = password[:-2]
-                password = password.strip()
+                password = password.strip().decode('latin-1')
 
                 logger.info(f"Password field found in upload. Length: {len(password) if password else 0}")
 
@@ -167,11 +215,11 @@ def parse_multipart_data(body, content_type):
             elif 'name="bank_id"' in content_disposition:
                 # Extract bank_id value
                 bank_id = content.strip()
-                if bank_id.endswith(f'--{boundary}'):
-                    bank_id = bank_id[:-len(f'--{boundary}')]
-                elif bank_id.endswith('--'):
+                if bank_id.endswith(boundary_marker):
+                    bank_id = bank_id[:-len(boundary_marker)]
+                elif bank_id.endswith(b'--'):
                     bank_id = bank_id[:-2]
-                bank_id = bank_id.strip()
+                bank_id = bank_id.strip().decode('latin-1')
 
                 logger.info(f"Bank ID field found in upload: {bank_id}")
 
@@ -207,7 +255,7 @@ def validate_bank_configuration(bank_id):
         logger.error(f"Bank validation error: {e}")
         return False, "Unable to validate bank selection. Please try again."
 
-def upload_to_s3(file_data, s3_key, content_type, metadata=None):
+async def upload_to_s3(s3, file_data, s3_key, content_type, metadata=None):
     """Upload file to S3 bucket"""
     try:
         upload_args = {
@@ -220,22 +268,35 @@ def upload_to_s3(file_data, s3_key, content_type, metadata=None):
         if metadata:
             upload_args['Metadata'] = metadata
 
-        s3_client.put_object(**upload_args)
+        await s3.put_object(**upload_args)
         return True
     except Exception as e:
         logger.error(f"S3 upload error: {e}")
         raise
 
-def save_to_dynamodb(job_data):
+async def save_to_dynamodb(jobs_table, job_data):
     """Save job metadata to DynamoDB"""
     try:
-        table = dynamodb.Table(JOBS_TABLE_NAME)
-        table.put_item(Item=job_data)
+        await jobs_table.put_item(Item=job_data)
         return True
     except Exception as e:
         logger.error(f"DynamoDB save error: {e}")
         raise
 
+async def store_upload(file_data, s3_key, metadata, job_data):
+    """Run the S3 upload and DynamoDB save concurrently - they are independent"""
+    clients = await _get_aio_clients()
+    await asyncio.gather(
+        upload_to_s3(
+            clients['s3'],
+            file_data=file_data,
+            s3_key=s3_key,
+            content_type='application/pdf',
+            metadata=metadata
+        ),
+        save_to_dynamodb(clients['jobs_table'], job_data)
+    )
+
 def trigger_processing(job_id, s3_key, user_id, filename):
     """Send SQS message to trigger PDF processing"""
     try:
@@ -306,10 +367,11 @@ def handle_upload(event):
                 })
             }
 
-        # Get body (handle base64 encoding if needed)
-        body = event.get('body', '')
+        # Get body as bytes (handle base64 encoding if needed)
         if event.get('isBase64Encoded', False):
-            body = base64.b64decode(body).decode('latin-1')
+            body = base64.b64decode(event.get('body', ''))
+        else:
+            body = event.get('body', '').encode('latin-1', errors='surrogateescape')
 
         # Parse multipart data
         file_data, filename, password, bank_id = parse_multipart_data(body, content_type)
@@ -377,8 +439,10 @@ def handle_upload(event):
             }
 
         # Generate unique job ID for tracking this upload throughout the system
-        job_id = str(uuid.uuid4())
+        # uuid.UUID over os.urandom skips uuid4's extra entropy-source checks
+        job_id = str(uuid.UUID(bytes=os.urandom(16), version=4))
         upload_timestamp = datetime.now(timezone.utc)
+        upload_iso = upload_timestamp.isoformat()  # formatted once, reused below
 
         # Create organized S3 key with hierarchical structure for efficient storage and retrieval
         # Format: uploads/YYYY/MM/DD/uuid_originalfilename.pdf
@@ -388,20 +452,11 @@ def handle_upload(event):
         # - UUID prefix prevents filename conflicts and ensures uniqueness
         # - Original filename preserved for user reference and download
         # - Hierarchical structure supports efficient querying and organization
-        s3_key = f"uploads/{upload_timestamp.strftime('%Y/%m/%d')}/{job_id}_{filename}"
-
-        # Upload to S3
-        upload_to_s3(
-            file_data=file_data,
-            s3_key=s3_key,
-            content_type='application/pdf',
-            metadata={
-                'original_filename': filename,
-                'uploaded_by': default_user_id,
-                'upload_timestamp': upload_timestamp.isoformat(),
-                'job_id': job_id
-            }
-        )
+        # Sanitize the user-supplied filename so path separators or control
+        # characters cannot leak into the key structure
+        safe_filename = UNSAFE_FILENAME_PATTERN.sub('_', filename)
+        s3_key = (f"uploads/{upload_timestamp.year:04d}/{upload_timestamp.month:02d}/"
+                  f"{upload_timestamp.day:02d}/{job_id}_{safe_filename}")
 
         # Store password if provided
         plain_password = None
@@ -410,11 +465,11 @@ def handle_upload(event):
             logger.info(f"Password will be stored for job: {job_id} (length: {len(plain_password)})")
 
         # Save to DynamoDB
-        ttl = int((upload_timestamp + timedelta(days=60)).timestamp())  # 60 days TTL
+        ttl = int(upload_timestamp.timestamp()) + JOB_TTL_SECONDS  # 60 days TTL
         job_data = {
             'job_id': job_id,
             'user_id': default_user_id,
-            'created_at': upload_timestamp.isoformat(),
+            'created_at': upload_iso,
             'status': 'uploaded',
             'job_type': 'file_upload',
             'original_filename': filename,
@@ -422,7 +477,7 @@ def handle_upload(event):
             'file_size_bytes': file_size,
             'file_size_mb': Decimal(str(round(file_size_mb, 2))),
             'content_type': 'application/pdf',
-            'upload_timestamp': upload_timestamp.isoformat(),
+            'upload_timestamp': upload_iso,
             'ttl': ttl,
             'metadata': {
                 'upload_source': 'aws_api_gateway',
@@ -437,7 +492,18 @@ def handle_upload(event):
         if plain_password:
             job_data['password'] = plain_password
 
-        save_to_dynamodb(job_data)
+        # Upload to S3 and save to DynamoDB in parallel on the long-lived loop
+        aio_loop.run_until_complete(store_upload(
+            file_data=file_data,
+            s3_key=s3_key,
+            metadata={
+                'original_filename': filename,
+                'uploaded_by': default_user_id,
+                'upload_timestamp': upload_iso,
+                'job_id': job_id
+            },
+            job_data=job_data
+        ))
 
         # Automatically trigger processing
         processing_triggered = trigger_processing(job_id, s3_key, default_user_id, filename)
@@ -474,7 +540,7 @@ def handle_upload(event):
                 'filename': filename,
                 'file_size_mb': round(file_size_mb, 2),
                 's3_key': s3_key,
-                'upload_timestamp': upload_timestamp.isoformat(),
+                'upload_timestamp': upload_iso,
                 'file_metadata': {
                     'job_id': job_id,
                     'original_filename': filename,
@@ -3,15 +3,42 @@
 Structured logging configuration for AWS Lambda and CloudWatch
 """
 
+import atexit
 import logging
 import json
+import queue
 import sys
+import time
 import traceback
-from datetime import datetime
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Dict, Optional
 from config import settings
 import uuid
 
+# orjson serializes ~5-10x faster than stdlib json; fall back silently so the
+# dependency stays optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# LogRecord attributes (plus our context fields) excluded from the "extra"
+# block - hoisted to module scope so format() does a C-level set difference
+# instead of rebuilding this set per record
+_STD_LOGRECORD_KEYS = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+    'filename', 'module', 'lineno', 'funcName', 'created', 'msecs',
+    'relativeCreated', 'thread', 'threadName', 'processName',
+    'process', 'message', 'exc_info', 'exc_text', 'stack_info',
+    'request_id', 'user_id', 'file_hash', 'processing_time'
+})
+
+# Bound once - avoids module attribute lookups per record
+_gmtime = time.gmtime
+_strftime = time.strftime
+
+
 class CloudWatchFormatter(logging.Formatter):
     """Custom formatter for CloudWatch logs with structured JSON output"""
     
@@ -25,9 +52,13 @@ class CloudWatchFormatter(logging.Formatter):
         Returns:
             JSON formatted log string
         """
-        # Base log structure
+        # Base log structure - timestamp comes from record.created, which the
+        # LogRecord already carries, instead of allocating a datetime object
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": "%s.%03dZ" % (
+                _strftime('%Y-%m-%dT%H:%M:%S', _gmtime(record.created)),
+                record.msecs
+            ),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -49,69 +80,101 @@ class CloudWatchFormatter(logging.Formatter):
         if hasattr(record, 'processing_time'):
             log_entry["processing_time_ms"] = record.processing_time
         
-        # Add exception information if present
+        # Add exception information if present - the traceback is a single
+        # joined string, cached on the record so repeated handlers don't
+        # re-render it
         if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = ''.join(traceback.format_exception(*record.exc_info))
             log_entry["exception"] = {
                 "type": record.exc_info[0].__name__ if record.exc_info[0] else None,
                 "message": str(record.exc_info[1]) if record.exc_info[1] else None,
-                "traceback": traceback.format_exception(*record.exc_info)
+                "traceback": record.exc_text
             }
         
         # Add extra fields
-        extra_fields = {}
-        for key, value in record.__dict__.items():
-            if key not in {'name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 
-                          'filename', 'module', 'lineno', 'funcName', 'created', 'msecs', 
-                          'relativeCreated', 'thread', 'threadName', 'processName', 
-                          'process', 'message', 'exc_info', 'exc_text', 'stack_info',
-                          'request_id', 'user_id', 'file_hash', 'processing_time'}:
-                extra_fields[key] = value
-        
-        if extra_fields:
-            log_entry["extra"] = extra_fields
+        record_dict = record.__dict__
+        extra_keys = record_dict.keys() - _STD_LOGRECORD_KEYS
+        if extra_keys:
+            log_entry["extra"] = {key: record_dict[key] for key in extra_keys}
         
+        if orjson is not None:
+            return orjson.dumps(log_entry, default=str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
         return json.dumps(log_entry, default=str, ensure_ascii=False)
 
+# Request context carried in ContextVars so concurrent invocations (threads
+# or asyncio tasks) each see their own values instead of sharing filter state
+_request_id_var: ContextVar[Optional[str]] = ContextVar('request_id', default=None)
+_user_id_var: ContextVar[Optional[str]] = ContextVar('user_id', default=None)
+
 class ContextFilter(logging.Filter):
     """Filter to add context information to log records"""
-    
-    def __init__(self):
-        super().__init__()
-        self.request_id = None
-        self.user_id = None
-    
+
     def filter(self, record: logging.LogRecord) -> bool:
         """
         Add context information to log record
-        
+
         Args:
             record: Log record to modify
-            
+
         Returns:
             True to allow record through
         """
         # Add context if available
-        if self.request_id:
-            record.request_id = self.request_id
-        if self.user_id:
-            record.user_id = self.user_id
-        
+        request_id = _request_id_var.get()
+        if request_id is not None:
+            record.request_id = request_id
+        user_id = _user_id_var.get()
+        if user_id is not None:
+            record.user_id = user_id
+
         return True
-    
+
     def set_context(self, request_id: Optional[str] = None, user_id: Optional[str] = None):
         """Set context for logging"""
         if request_id:
-            self.request_id = request_id
+            _request_id_var.set(request_id)
         if user_id:
-            self.user_id = user_id
+            _user_id_var.set(user_id)
+
+class AsyncBufferedHandler(QueueHandler):
+    """
+    Queue-backed handler that hands records to a background writer thread
+
+    JSON serialization and the stdout write happen on the listener thread,
+    so the request thread only pays for a queue put per log call.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Finalize the message on the calling thread, keep the rest live
+
+        Records never cross a process boundary here, so the default
+        deep-freeze (which drops exc_info needed by CloudWatchFormatter)
+        is skipped. Only the message args are resolved eagerly in case
+        callers mutate them after logging.
+        """
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
 
 # Global context filter instance
 context_filter = ContextFilter()
 
+# Background listener that drains the log queue (started by setup_logging)
+_queue_listener: Optional[QueueListener] = None
+
 def setup_logging():
     """
     Configure logging for Lambda environment
     """
+    # Idempotent: handlers are configured once at import; re-entry from other
+    # modules must not thrash handlers or duplicate every log line
+    if getattr(setup_logging, '_configured', False):
+        return
+    setup_logging._configured = True
+
     # Get root logger
     root_logger = logging.getLogger()
     
@@ -122,19 +185,32 @@ def setup_logging():
     log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
     root_logger.setLevel(log_level)
     
-    # Create CloudWatch handler
+    # Create CloudWatch handler (runs on the listener thread)
     handler = logging.StreamHandler(sys.stdout)
     handler.setLevel(log_level)
-    
+
     # Set custom formatter
     formatter = CloudWatchFormatter()
     handler.setFormatter(formatter)
-    
-    # Add context filter
-    handler.addFilter(context_filter)
-    
+
+    # Request threads only enqueue records; the listener thread formats and
+    # writes them, keeping JSON encoding out of the request path
+    log_queue = queue.SimpleQueue()
+    queue_handler = AsyncBufferedHandler(log_queue)
+    queue_handler.setLevel(log_level)
+
+    # Add context filter at enqueue time so request context is captured
+    queue_handler.addFilter(context_filter)
+
     # Add handler to root logger
-    root_logger.addHandler(handler)
+    root_logger.addHandler(queue_handler)
+
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+    _queue_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _queue_listener.start()
+    atexit.register(_queue_listener.stop)
     
     # Configure specific loggers
     
@@ -142,18 +218,46 @@ def setup_logging():
     logging.getLogger('urllib3').setLevel(logging.WARNING)
     logging.getLogger('botocore').setLevel(logging.WARNING)
     logging.getLogger('boto3').setLevel(logging.WARNING)
+    logging.getLogger('s3transfer').setLevel(logging.WARNING)
+    # pypdf logs a warning per malformed object, which adds up on bank PDFs
+    logging.getLogger('pypdf').setLevel(logging.ERROR)
     
     # Set our application logger
     app_logger = logging.getLogger(__name__.split('.')[0])
     app_logger.setLevel(log_level)
 
+def flush_logs():
+    """
+    Drain queued log records before the execution environment freezes
+
+    Records handed to the listener thread are lost if Lambda freezes (or
+    tears down - atexit is not guaranteed to run there) before the thread
+    writes them. stop() joins the listener only after every record already
+    queued has been handled; start() re-arms it for the next invocation.
+    Call this at the end of a Lambda handler.
+    """
+    if _queue_listener is None:
+        return
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.flush()
+    _queue_listener.start()
+
 class LoggerMixin:
     """Mixin class to add structured logging capabilities"""
-    
+
+    _class_logger: Optional[logging.Logger] = None
+
+    def __init_subclass__(cls, **kwargs):
+        # Resolve the logger once per subclass - getLogger takes the global
+        # logging lock, so keep it off the per-call path
+        super().__init_subclass__(**kwargs)
+        cls._class_logger = logging.getLogger(cls.__module__)
+
     @property
     def logger(self) -> logging.Logger:
         """Get logger for this class"""
-        return logging.getLogger(self.__class__.__module__)
+        return self._class_logger or logging.getLogger(self.__class__.__module__)
     
     def log_info(self, message: str, **kwargs):
         """Log info message with extra context"""
@@ -183,73 +287,85 @@ def log_performance(func):
     """
     import time
     import functools
-    
+
+    # Resolved once at decoration time - logging.getLogger takes the global
+    # logging lock and walks the hierarchy, so keep it out of the call path
+    logger = logging.getLogger(func.__module__)
+
     @functools.wraps(func)
     async def async_wrapper(*args, **kwargs):
-        start_time = time.time()
-        logger = logging.getLogger(func.__module__)
-        
+        # Skip timing and extra-dict construction entirely when INFO logging
+        # is disabled - the success path then costs a single level check
+        enabled = logger.isEnabledFor(logging.INFO)
+        start_time = time.time() if enabled else None
+
         try:
             result = await func(*args, **kwargs)
-            duration = (time.time() - start_time) * 1000  # Convert to milliseconds
-            
-            logger.info(
-                f"Function {func.__name__} completed successfully",
-                extra={
-                    "function": func.__name__,
-                    "processing_time": duration,
-                    "status": "success"
-                }
-            )
+            if enabled:
+                duration = (time.time() - start_time) * 1000  # Convert to milliseconds
+
+                logger.info(
+                    f"Function {func.__name__} completed successfully",
+                    extra={
+                        "function": func.__name__,
+                        "processing_time": duration,
+                        "status": "success"
+                    }
+                )
             return result
-            
+
         except Exception as e:
-            duration = (time.time() - start_time) * 1000
-            
+            extra = {
+                "function": func.__name__,
+                "status": "error",
+                "error_type": type(e).__name__,
+                "error_message": str(e)
+            }
+            if start_time is not None:
+                extra["processing_time"] = (time.time() - start_time) * 1000
+
             logger.error(
                 f"Function {func.__name__} failed",
-                extra={
-                    "function": func.__name__,
-                    "processing_time": duration,
-                    "status": "error",
-                    "error_type": type(e).__name__,
-                    "error_message": str(e)
-                },
+                extra=extra,
                 exc_info=True
             )
             raise
-    
+
     @functools.wraps(func)
     def sync_wrapper(*args, **kwargs):
-        start_time = time.time()
-        logger = logging.getLogger(func.__module__)
-        
+        # Skip timing and extra-dict construction entirely when INFO logging
+        # is disabled - the success path then costs a single level check
+        enabled = logger.isEnabledFor(logging.INFO)
+        start_time = time.time() if enabled else None
+
         try:
             result = func(*args, **kwargs)
-            duration = (time.time() - start_time) * 1000
-            
-            logger.info(
-                f"Function {func.__name__} completed successfully",
-                extra={
-                    "function": func.__name__,
-                    "processing_time": duration,
-                    "status": "success"
-                }
-            )
+            if enabled:
+                duration = (time.time() - start_time) * 1000
+
+                logger.info(
+                    f"Function {func.__name__} completed successfully",
+                    extra={
+                        "function": func.__name__,
+                        "processing_time": duration,
+                        "status": "success"
+                    }
+                )
             return result
-            
+
         except Exception as e:
-            duration = (time.time() - start_time) * 1000
-            
+            extra = {
+                "function": func.__name__,
+                "status": "error",
+                "error_type": type(e).__name__,
+                "error_message": str(e)
+            }
+            if start_time is not None:
+                extra["processing_time"] = (time.time() - start_time) * 1000
+
             logger.error(
                 f"Function {func.__name__} failed",
-                extra={
-                    "function": func.__name__,
-                    "processing_time": duration,
-                    "status": "error",
-                    "error_type": type(e).__name__,
-                    "error_message": str(e)
-                },
+                extra=extra,
                 exc_info=True
             )
             raise
@@ -263,7 +379,9 @@ def log_performance(func):
 
 class SecurityLogger:
     """Specialized logger for security events"""
-    
+
+    __slots__ = ('logger',)
+
     def __init__(self):
         self.logger = logging.getLogger(f"{__name__}.security")
     
@@ -305,7 +423,7 @@ class SecurityLogger:
     def log_suspicious_activity(self, description: str, **kwargs):
         """Log suspicious activity"""
         self.logger.warning(
-            f"Suspicious activity detected: {description}",
+            "Suspicious activity detected: %s", description,
             extra={
                 "event_type": "suspicious_activity",
                 "description": description,
@@ -328,6 +446,9 @@ class SecurityLogger:
 # Global security logger instance
 security_logger = SecurityLogger()
 
+# Module-level logger for the API request/response helpers below
+_api_logger = logging.getLogger(__name__)
+
 # Utility functions for common logging patterns
 def set_request_context(request_id: str, user_id: Optional[str] = None):
     """Set request context for logging"""
@@ -339,8 +460,7 @@ def generate_request_id() -> str:
 
 def log_api_request(method: str, path: str, user_id: Optional[str] = None, **kwargs):
     """Log API request"""
-    logger = logging.getLogger(__name__)
-    logger.info(
+    _api_logger.info(
         f"API request: {method} {path}",
         extra={
             "event_type": "api_request",
@@ -353,8 +473,7 @@ def log_api_request(method: str, path: str, user_id: Optional[str] = None, **kwa
 
 def log_api_response(status_code: int, processing_time: float, **kwargs):
     """Log API response"""
-    logger = logging.getLogger(__name__)
-    logger.info(
+    _api_logger.info(
         f"API response: {status_code}",
         extra={
             "event_type": "api_response",
@@ -5,8 +5,8 @@ This module provides PDF validation functionality to check if PDFs
 can be processed before attempting extraction.
 """
 
-from .pdf_validator import PDFValidator
+from .pdf_validator import PDFValidator, validate_many
 from .error_codes import ErrorCode
 from .validation_result import ValidationResult, PDFType
 
-__all__ = ['PDFValidator', 'ErrorCode', 'ValidationResult', 'PDFType']
\ No newline at end of file
+__all__ = ['PDFValidator', 'validate_many', 'ErrorCode', 'ValidationResult', 'PDFType']
\ No newline at end of file
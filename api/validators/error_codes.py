@@ -6,6 +6,7 @@ during PDF validation, with corresponding user-friendly messages.
 """
 
 from enum import Enum
+from functools import lru_cache
 
 
 class ErrorCode(Enum):
@@ -35,6 +36,12 @@ ERROR_MESSAGES = {
 }
 
 
+@lru_cache(maxsize=len(ErrorCode))
+def _get_error_message_plain(error_code: ErrorCode) -> str:
+    """Memoized lookup for messages that need no parameter formatting."""
+    return ERROR_MESSAGES.get(error_code, "Unknown validation error")
+
+
 def get_error_message(error_code: ErrorCode, **kwargs) -> str:
     """
     Get user-friendly error message for the given error code.
@@ -46,6 +53,10 @@ def get_error_message(error_code: ErrorCode, **kwargs) -> str:
     Returns:
         User-friendly error message
     """
+    # Most error paths pass no kwargs - serve those from the memoized lookup
+    if not kwargs:
+        return _get_error_message_plain(error_code)
+
     message = ERROR_MESSAGES.get(error_code, "Unknown validation error")
 
     # Format message with additional parameters if needed
@@ -6,9 +6,14 @@ for transaction extraction. It performs various checks without extracting
 any data.
 """
 
+import hashlib
 import os
 import logging
-from typing import Optional, Tuple
+import struct
+from collections import OrderedDict
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Final, Iterable, List, Optional, Tuple
 import pypdf
 
 from .validation_result import ValidationResult, PDFType
@@ -16,6 +21,54 @@ from .error_codes import ErrorCode, get_error_message
 
 logger = logging.getLogger(__name__)
 
+# Hard limits as per plan; module-level so method bodies read them without
+# an attribute lookup per use (mirrored on the class for callers and tests)
+MAX_PAGES: Final[int] = 200
+MAX_FILE_SIZE_MB: Final[int] = 25
+MIN_TEXT_LENGTH: Final[int] = 100
+
+# b'%PDF' packed as a little-endian uint32, so the magic check is a single
+# integer comparison instead of a bytes richcompare
+_PDF_MAGIC_LE = 0x46445025
+
+# Memoized validation results keyed on content fingerprint + password, so
+# re-validating the same bytes (retries, re-uploads) skips the pypdf parse
+_VALIDATION_CACHE_MAX = 256
+_validation_cache: "OrderedDict[tuple, ValidationResult]" = OrderedDict()
+
+
+def _extract_page_text_isolated(pdf_path: str, password: Optional[str], page_index: int) -> str:
+    """
+    Extract one page's text from a private PdfReader.
+
+    Each worker thread opens its own reader: pages of a shared reader seek
+    and read one shared file handle, and concurrent access can silently
+    return corrupted stream data rather than raising. Mirrors the
+    per-worker reopen in extractors.base_extractor._extract_page_text_batch.
+    """
+    with open(pdf_path, 'rb') as file:
+        pdf_reader = pypdf.PdfReader(file)
+
+        if pdf_reader.is_encrypted and password is not None:
+            if pdf_reader.decrypt(password) == 0:
+                pdf_reader.decrypt(password.strip())
+
+        return pdf_reader.pages[page_index].extract_text() or ""
+
+
+def _page_has_image(page) -> bool:
+    """Check whether a page's resource dictionary references an image XObject."""
+    try:
+        if '/Resources' in page and '/XObject' in page['/Resources']:
+            xobjects = page['/Resources']['/XObject']
+            return any(
+                xobjects[name].get('/Subtype') == '/Image'
+                for name in xobjects
+            )
+    except Exception as e:
+        logger.debug("Error checking page for images: %s", e)
+    return False
+
 
 class PDFValidator:
     """
@@ -25,10 +78,10 @@ class PDFValidator:
     can be processed, providing clear feedback on any issues found.
     """
 
-    # Hard limits as per plan
-    MAX_PAGES = 200
-    MAX_FILE_SIZE_MB = 25
-    MIN_TEXT_LENGTH = 100
+    # Mirrors of the module-level limits, kept for existing callers
+    MAX_PAGES = MAX_PAGES
+    MAX_FILE_SIZE_MB = MAX_FILE_SIZE_MB
+    MIN_TEXT_LENGTH = MIN_TEXT_LENGTH
 
     def validate(self, pdf_path: str, password: Optional[str] = None) -> ValidationResult:
         """
@@ -41,67 +94,149 @@ class PDFValidator:
         Returns:
             ValidationResult containing validation status and details
         """
-        logger.info(f"Starting PDF validation for: {pdf_path}")
+        logger.info("Starting PDF validation for: %s", pdf_path)
+
+        # Deterministic for identical content + password, so serve repeats
+        # from the cache and skip the parse entirely
+        fingerprint = self._content_fingerprint(pdf_path)
+        cache_key = (fingerprint, password) if fingerprint else None
+        if cache_key is not None:
+            cached = _validation_cache.get(cache_key)
+            if cached is not None:
+                _validation_cache.move_to_end(cache_key)
+                logger.debug("Validation cache hit for: %s", pdf_path)
+                return cached
 
         try:
-            # Step 1: File integrity check
-            if not self._is_valid_pdf_file(pdf_path):
-                return self._create_error_result(
-                    ErrorCode.NOT_PDF,
-                    PDFType.INVALID
-                )
-
-            # Step 2: File size check
-            file_size_mb = self._get_file_size_mb(pdf_path)
-            if file_size_mb > self.MAX_FILE_SIZE_MB:
-                return self._create_error_result(
+            # Steps 1 + 2: file size and integrity from a single open/stat/read.
+            # Size is checked first so oversized files are rejected without
+            # reading a single content byte.
+            size_bytes, header = self._stat_and_header(pdf_path)
+            file_size_mb = size_bytes / (1024 * 1024)
+
+            if file_size_mb > MAX_FILE_SIZE_MB:
+                result = self._create_error_result(
                     ErrorCode.FILE_TOO_LARGE,
                     PDFType.INVALID,
                     metadata={"file_size_mb": file_size_mb},
                     file_size_mb=file_size_mb
                 )
+            elif (int.from_bytes(header[:4], 'little') != _PDF_MAGIC_LE
+                    or not header.startswith(b'-', 4)):
+                result = self._create_error_result(
+                    ErrorCode.NOT_PDF,
+                    PDFType.INVALID
+                )
+            elif password is None and self._peek_encrypted(pdf_path):
+                # The trailer keeps /Encrypt near EOF, so an encrypted file
+                # with no password can be rejected without parsing the xref
+                result = self._create_error_result(
+                    ErrorCode.ENCRYPTED_NO_PASSWORD,
+                    PDFType.INVALID,
+                    metadata={"encryption": True}
+                )
+            else:
+                # Step 3: PDF structure validation and content analysis
+                result = self._validate_pdf_content(pdf_path, password, file_size_mb)
 
-            # Step 3: PDF structure validation and content analysis
-            return self._validate_pdf_content(pdf_path, password, file_size_mb)
-
+        except OSError as e:
+            # Missing or unreadable files are not PDFs we can process
+            logger.error("Cannot read PDF file %s: %s", pdf_path, e)
+            return self._create_error_result(
+                ErrorCode.NOT_PDF,
+                PDFType.INVALID
+            )
         except Exception as e:
-            logger.error(f"Unexpected error during PDF validation: {e}", exc_info=True)
+            logger.error("Unexpected error during PDF validation: %s", e, exc_info=True)
+            # Unexpected failures may be transient - do not cache them
             return self._create_error_result(
                 ErrorCode.CORRUPTED,
                 PDFType.INVALID,
                 metadata={"validation_error": str(e)}
             )
 
-    def _is_valid_pdf_file(self, pdf_path: str) -> bool:
-        """Check if file is actually a PDF using magic bytes."""
+        if cache_key is not None:
+            _validation_cache[cache_key] = result
+            if len(_validation_cache) > _VALIDATION_CACHE_MAX:
+                _validation_cache.popitem(last=False)
+
+        return result
+
+    # Bytes hashed from each end of the file for the cache fingerprint
+    _FINGERPRINT_SPAN = 65536
+
+    def _content_fingerprint(self, pdf_path: str) -> Optional[str]:
+        """
+        Digest of the file used as the validation cache key.
+
+        Hashes only the first and last 64 KB plus the exact size: the PDF
+        header and xref trailer live at the ends of the file, so this
+        distinguishes real-world files without reading a 25 MB statement in
+        full just to build a cache key.
+        """
         try:
-            # Check if file exists
-            if not os.path.exists(pdf_path):
-                logger.error(f"PDF file does not exist: {pdf_path}")
-                return False
+            digest = hashlib.blake2b(digest_size=16)
+            fd = os.open(pdf_path, os.O_RDONLY)
+            try:
+                size = os.fstat(fd).st_size
+                digest.update(struct.pack('<Q', size))
+                digest.update(os.read(fd, self._FINGERPRINT_SPAN))
+                if size > self._FINGERPRINT_SPAN:
+                    os.lseek(fd, -min(self._FINGERPRINT_SPAN, size - self._FINGERPRINT_SPAN), os.SEEK_END)
+                    digest.update(os.read(fd, self._FINGERPRINT_SPAN))
+            finally:
+                os.close(fd)
+            return digest.hexdigest()
+        except OSError:
+            # Missing/unreadable files take the uncached path
+            return None
+
+    def _stat_and_header(self, pdf_path: str) -> Tuple[int, bytes]:
+        """
+        Fetch file size and magic bytes in one open/fstat/read pass.
+
+        Returns:
+            Tuple of (size_bytes, header)
 
-            # Check magic bytes
-            with open(pdf_path, 'rb') as f:
-                header = f.read(4)
-                is_pdf = header == b'%PDF'
+        Raises:
+            OSError: if the file is missing or unreadable
+        """
+        fd = os.open(pdf_path, os.O_RDONLY)
+        try:
+            size_bytes = os.fstat(fd).st_size
+            if size_bytes > MAX_FILE_SIZE_MB * 1024 * 1024:
+                # Caller rejects on size alone - no point touching content
+                header = b''
+            else:
+                header = os.read(fd, 8)
+        finally:
+            os.close(fd)
 
-            logger.debug(f"Magic bytes check: {'PASS' if is_pdf else 'FAIL'}")
-            return is_pdf
+        logger.debug("File size: %.2fMB", size_bytes / (1024 * 1024))
+        return size_bytes, header
 
-        except Exception as e:
-            logger.error(f"Error checking PDF magic bytes: {e}")
-            return False
+    def _peek_encrypted(self, pdf_path: str) -> bool:
+        """
+        Scan the file tail for an /Encrypt trailer entry.
 
-    def _get_file_size_mb(self, pdf_path: str) -> float:
-        """Get file size in MB."""
+        Checking the last 2 KB is far cheaper than letting pypdf load the
+        xref just to read is_encrypted. Only used to gate the no-password
+        cheap reject: when a password is supplied the full decrypt path runs
+        regardless, so the rare false positive (the bytes appearing in
+        unrelated tail content) cannot block a legitimate upload.
+        """
         try:
-            size_bytes = os.path.getsize(pdf_path)
-            size_mb = size_bytes / (1024 * 1024)
-            logger.debug(f"File size: {size_mb:.2f}MB")
-            return size_mb
-        except Exception as e:
-            logger.error(f"Error getting file size: {e}")
-            return 0.0
+            fd = os.open(pdf_path, os.O_RDONLY)
+            try:
+                size = os.fstat(fd).st_size
+                os.lseek(fd, max(0, size - 2048), os.SEEK_SET)
+                tail = os.read(fd, 2048)
+            finally:
+                os.close(fd)
+            return b'/Encrypt' in tail
+        except OSError as e:
+            logger.debug("Error peeking at PDF trailer: %s", e)
+            return False
 
     def _validate_pdf_content(self, pdf_path: str, password: Optional[str], file_size_mb: float) -> ValidationResult:
         """Validate PDF structure and content."""
@@ -134,8 +269,8 @@ class PDFValidator:
                             )
 
                 # Check page count
-                page_count = len(pdf_reader.pages)
-                logger.debug(f"Page count: {page_count}")
+                page_count = self._fast_page_count(pdf_reader)
+                logger.debug("Page count: %d", page_count)
 
                 if page_count == 0:
                     return self._create_error_result(
@@ -144,7 +279,7 @@ class PDFValidator:
                         metadata={"page_count": 0}
                     )
 
-                if page_count > self.MAX_PAGES:
+                if page_count > MAX_PAGES:
                     return self._create_error_result(
                         ErrorCode.TOO_MANY_PAGES,
                         PDFType.INVALID,
@@ -153,8 +288,10 @@ class PDFValidator:
                     )
 
                 # Analyze content type
-                pdf_type, text_length = self._analyze_pdf_content(pdf_reader)
-                logger.debug(f"PDF type: {pdf_type}, text length: {text_length}")
+                pdf_type, text_length = self._analyze_pdf_content(
+                    pdf_reader, page_count, pdf_path, password
+                )
+                logger.debug("PDF type: %s, text length: %d", pdf_type, text_length)
 
                 # Create metadata
                 metadata = {
@@ -189,97 +326,135 @@ class PDFValidator:
                 )
 
         except Exception as e:
-            logger.error(f"Error validating PDF structure: {e}", exc_info=True)
+            logger.error("Error validating PDF structure: %s", e, exc_info=True)
             return self._create_error_result(
                 ErrorCode.CORRUPTED,
                 PDFType.INVALID,
                 metadata={"structure_error": str(e)}
             )
 
-    def _analyze_pdf_content(self, pdf_reader) -> Tuple[PDFType, int]:
+    def _fast_page_count(self, pdf_reader) -> int:
+        """
+        Read the page count from the Pages root dictionary.
+
+        The /Count entry is a plain integer in the document catalog, so this
+        avoids walking the full page tree the way len(pdf_reader.pages) does.
+        Falls back to the full walk for malformed catalogs.
+        """
+        try:
+            return int(pdf_reader.trailer['/Root']['/Pages']['/Count'])
+        except Exception as e:
+            logger.debug("Falling back to full page-tree walk for count: %s", e)
+            return len(pdf_reader.pages)
+
+    def _analyze_pdf_content(
+        self,
+        pdf_reader,
+        page_count: int,
+        pdf_path: str,
+        password: Optional[str]
+    ) -> Tuple[PDFType, int]:
         """
         Analyze if PDF is text-based or scanned.
 
         Returns:
             Tuple of (PDFType, text_length)
         """
-        total_text = ""
+        text_length = 0
         has_images = False
 
         # Sample first 5 pages or all pages if less
-        pages_to_check = min(5, len(pdf_reader.pages))
-        logger.debug(f"Analyzing content of {pages_to_check} pages")
+        pages_to_check = min(5, page_count)
+        logger.debug("Analyzing content of %d pages", pages_to_check)
 
         try:
-            for i in range(pages_to_check):
-                page = pdf_reader.pages[i]
+            # Materialize the sampled pages once; each pdf_reader.pages[i]
+            # access walks the page tree from the root otherwise
+            pages = list(islice(pdf_reader.pages, pages_to_check))
+        except Exception as e:
+            logger.warning("Error reading PDF pages: %s", e)
+            return PDFType.INVALID, 0
 
-                # Extract text
-                text = page.extract_text() or ""
-                total_text += text
+        # Text extraction dominates the analysis and releases the GIL in its
+        # decompression calls, so run the sampled pages concurrently. Each
+        # worker reopens the file with its own reader - a shared reader is
+        # not thread-safe - and any failure falls back to serial.
+        texts = None
+        if len(pages) > 1:
+            try:
+                with ThreadPoolExecutor(max_workers=len(pages)) as executor:
+                    texts = list(executor.map(
+                        lambda i: _extract_page_text_isolated(pdf_path, password, i),
+                        range(len(pages))
+                    ))
+            except Exception as e:
+                logger.warning("Parallel text extraction failed, using serial path: %s", e)
+                texts = None
 
-                # Check for images (indicates possible scan)
+        try:
+            for i, page in enumerate(pages):
+
+                # Accumulate only the stripped length; keeping the text itself
+                # around would mean quadratic string concatenation
+                if texts is not None:
+                    text_length += len(texts[i].strip())
+                elif text_length < MIN_TEXT_LENGTH:
+                    # Validation only needs to know the threshold is met; once
+                    # it is, remaining pages are scanned for images only
+                    text_length += len((page.extract_text() or "").strip())
+
+                # Check for images (indicates possible scan); once one is
+                # found there is nothing more the check can tell us
                 if not has_images:
-                    try:
-                        if '/Resources' in page and '/XObject' in page['/Resources']:
-                            xobjects = page['/Resources']['/XObject']
-                            for obj_name in xobjects:
-                                xobject = xobjects[obj_name]
-                                if hasattr(xobject, 'get') and xobject.get('/Subtype') == '/Image':
-                                    has_images = True
-                                    break
-                    except Exception as e:
-                        logger.debug(f"Error checking for images in page {i}: {e}")
+                    has_images = _page_has_image(page)
+
+                # Classification is settled once we have both enough text and
+                # an image (HYBRID) - skip extracting the remaining pages
+                if has_images and text_length >= MIN_TEXT_LENGTH:
+                    logger.debug("Content classification settled after page %d", i + 1)
+                    break
 
         except Exception as e:
-            logger.warning(f"Error analyzing PDF content: {e}")
+            logger.warning("Error analyzing PDF content: %s", e)
             # If we can't analyze content, assume it might be problematic
             return PDFType.INVALID, 0
 
-        text_length = len(total_text.strip())
-
         # Classification logic
-        if text_length < self.MIN_TEXT_LENGTH:
+        if text_length < MIN_TEXT_LENGTH:
             if has_images:
                 return PDFType.SCANNED, text_length
             else:
                 return PDFType.INVALID, text_length
-        elif has_images and text_length >= self.MIN_TEXT_LENGTH:
+        elif has_images and text_length >= MIN_TEXT_LENGTH:
             return PDFType.HYBRID, text_length
         else:
             return PDFType.TEXT_BASED, text_length
 
+    # Info-dictionary keys projected into result metadata
+    _METADATA_FIELDS = {
+        '/Title': 'title',
+        '/Author': 'author',
+        '/Subject': 'subject',
+        '/Creator': 'creator',
+        '/Producer': 'producer',
+        '/CreationDate': 'creation_date',
+        '/ModDate': 'modification_date'
+    }
+
     def _extract_pdf_metadata(self, pdf_reader) -> dict:
         """Extract PDF metadata safely."""
-        metadata = {}
-
         try:
-            if pdf_reader.metadata:
-                # Safely extract metadata fields
-                for key, field_name in [
-                    ('/Title', 'title'),
-                    ('/Author', 'author'),
-                    ('/Subject', 'subject'),
-                    ('/Creator', 'creator'),
-                    ('/Producer', 'producer')
-                ]:
-                    value = pdf_reader.metadata.get(key)
-                    if value:
-                        metadata[field_name] = str(value)
-
-                # Handle dates carefully
-                for key, field_name in [
-                    ('/CreationDate', 'creation_date'),
-                    ('/ModDate', 'modification_date')
-                ]:
-                    value = pdf_reader.metadata.get(key)
-                    if value:
-                        metadata[field_name] = str(value)
-
+            # Resolve the Info dictionary once instead of per-key .get()
+            # calls, each of which resolves indirect objects separately
+            info = dict(pdf_reader.metadata or {})
+            return {
+                field_name: str(info[key])
+                for key, field_name in self._METADATA_FIELDS.items()
+                if info.get(key)
+            }
         except Exception as e:
-            logger.debug(f"Error extracting PDF metadata: {e}")
-
-        return metadata
+            logger.debug("Error extracting PDF metadata: %s", e)
+            return {}
 
     def _create_error_result(
         self,
@@ -297,4 +472,59 @@ class PDFValidator:
             error_message=get_error_message(error_code, **kwargs),
             metadata=metadata or {},
             confidence_score=confidence_score
-        )
\ No newline at end of file
+        )
+
+
+# Shared stateless instance; module-level validate() lets callers skip
+# instantiating PDFValidator per request
+DEFAULT_VALIDATOR = PDFValidator()
+validate = DEFAULT_VALIDATOR.validate
+
+
+def _validate_one(pdf_path: str, password: Optional[str]) -> ValidationResult:
+    """Worker for validate_many: validate a single file in a subprocess."""
+    return DEFAULT_VALIDATOR.validate(pdf_path, password)
+
+
+def validate_many(
+    pdf_paths: Iterable[str],
+    passwords: Optional[Dict[str, str]] = None,
+    workers: Optional[int] = None
+) -> List[ValidationResult]:
+    """
+    Validate a batch of PDF files across worker processes.
+
+    Validation is CPU-bound inside pypdf, so fanning paths out to a
+    process pool scales with cores for corpus-sized batches. Results are
+    returned in input order.
+
+    Args:
+        pdf_paths: Paths of the PDF files to validate
+        passwords: Optional mapping of path -> password for encrypted files
+        workers: Process count (defaults to CPU count, capped at batch size)
+
+    Returns:
+        List of ValidationResult in the same order as pdf_paths
+    """
+    paths = list(pdf_paths)
+    if not paths:
+        return []
+
+    passwords = passwords or {}
+    path_passwords = [passwords.get(path) for path in paths]
+    workers = workers or min(os.cpu_count() or 1, len(paths))
+
+    if workers < 2 or len(paths) < 2:
+        return [_validate_one(path, pw) for path, pw in zip(paths, path_passwords)]
+
+    # Chunk the batch so each worker handles several files per IPC round trip
+    chunksize = max(1, len(paths) // (workers * 4))
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                _validate_one, paths, path_passwords, chunksize=chunksize
+            ))
+    except OSError as e:
+        # Process pools need shared memory the Lambda sandbox does not offer
+        logger.warning("Process pool unavailable (%s), validating serially", e)
+        return [_validate_one(path, pw) for path, pw in zip(paths, path_passwords)]
\ No newline at end of file
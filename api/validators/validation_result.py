@@ -18,13 +18,16 @@ class PDFType(Enum):
     INVALID = "invalid"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """
     Result of PDF validation process.
 
     This structure contains all information about whether a PDF
     can be processed and any issues found during validation.
+
+    Instances are immutable and slotted: results are shared via the
+    validator cache, and slots drop the per-instance __dict__ overhead.
     """
 
     is_valid: bool
@@ -47,18 +50,21 @@ class ValidationResult:
 
     def __post_init__(self):
         """Validate the result structure after initialization."""
-        # Ensure confidence score is within valid range
-        if not 0.0 <= self.confidence_score <= 1.0:
-            raise ValueError(f"Confidence score must be between 0.0 and 1.0, got {self.confidence_score}")
-
-        # Ensure metadata is a dictionary
-        if not isinstance(self.metadata, dict):
-            raise ValueError("Metadata must be a dictionary")
-
-        # Valid PDFs should have VALID error code and high confidence
-        if self.is_valid and self.error_code != ErrorCode.VALID:
-            raise ValueError("Valid PDFs must have ErrorCode.VALID")
-
-        # Invalid PDFs should not have VALID error code
-        if not self.is_valid and self.error_code == ErrorCode.VALID:
-            raise ValueError("Invalid PDFs cannot have ErrorCode.VALID")
\ No newline at end of file
+        # These invariants are guaranteed by the producer (PDFValidator), so
+        # treat them like assertions: python -O elides the whole branch
+        if __debug__:
+            # Ensure confidence score is within valid range
+            if not 0.0 <= self.confidence_score <= 1.0:
+                raise ValueError(f"Confidence score must be between 0.0 and 1.0, got {self.confidence_score}")
+
+            # Ensure metadata is a dictionary
+            if not isinstance(self.metadata, dict):
+                raise ValueError("Metadata must be a dictionary")
+
+            # Valid PDFs should have VALID error code and high confidence
+            if self.is_valid and self.error_code != ErrorCode.VALID:
+                raise ValueError("Valid PDFs must have ErrorCode.VALID")
+
+            # Invalid PDFs should not have VALID error code
+            if not self.is_valid and self.error_code == ErrorCode.VALID:
+                raise ValueError("Invalid PDFs cannot have ErrorCode.VALID")
\ No newline at end of file